@@ -12,7 +12,8 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from .config import Config
 from .api_client import ManagifyClient
-from .pdf_compiler import PdfCompiler
+from .pdf_compiler import PdfCompiler, BACKENDS
+from .latex_generator import LatexGenerator, SAMPLE_RESUME_DATA
 
 console = Console()
 
@@ -91,7 +92,8 @@ def list_jobs(status: str, category: str):
 @click.argument('job_id')
 @click.option('--output', '-o', default=None, help='Output filename (without extension)')
 @click.option('--latex-only', is_flag=True, help='Only save LaTeX source, skip PDF compilation')
-def tailor(job_id: str, output: str, latex_only: bool):
+@click.option('--backend', type=click.Choice(list(BACKENDS)), default=None, help='LaTeX backend to compile with (defaults to the calibrated choice)')
+def tailor(job_id: str, output: str, latex_only: bool, backend: str):
     """Generate a tailored LaTeX resume for a specific job."""
     try:
         client = ManagifyClient()
@@ -140,10 +142,11 @@ def tailor(job_id: str, output: str, latex_only: bool):
                     progress.remove_task(task3)
                     console.print("⚠️  PDF save failed", style="yellow")
             elif not latex_only:
-                # Compile locally using pdflatex
-                task3 = progress.add_task(description="Compiling PDF with pdflatex...", total=None)
+                # Compile locally using the selected LaTeX backend
+                engine = PdfCompiler.get_backend(backend)
+                task3 = progress.add_task(description=f"Compiling PDF with {engine.name}...", total=None)
                 
-                if PdfCompiler.compile(result['latexSource'], output_path):
+                if PdfCompiler.compile(result['latexSource'], output_path, engine.name):
                     pdf_file = output_path.with_suffix('.pdf')
                     progress.remove_task(task3)
                     console.print(f"✅ PDF compiled: [blue]{pdf_file}[/blue]", style="bold green")
@@ -173,8 +176,24 @@ def check():
         return
     
     # Check LaTeX
-    if PdfCompiler.check_latex_installed():
-        console.print("✅ LaTeX installed: [green]pdflatex found[/green]")
+    try:
+        engine = PdfCompiler.get_backend()
+    except ValueError as e:
+        engine = None
+        console.print(f"❌ LaTeX backend: {e}", style="red")
+        console.print("   Fix LATEX_BACKEND or run [yellow]resumeforge calibrate[/yellow]")
+    
+    available = [b.name for b in PdfCompiler.available_backends()]
+    if engine and engine.is_available():
+        console.print(f"✅ LaTeX installed: [green]{engine.name} found[/green]")
+        others = [name for name in available if name != engine.name]
+        if others:
+            console.print(f"   Other backends available: {', '.join(others)}")
+    elif available:
+        if engine:
+            console.print(f"❌ LaTeX backend {engine.name} not found", style="red")
+        console.print(f"   Installed backends: [green]{', '.join(available)}[/green]")
+        console.print("   Run [yellow]resumeforge calibrate[/yellow] to pick one as the default")
     else:
         console.print("❌ LaTeX not installed", style="red")
         console.print("   Install instructions:")
@@ -198,5 +217,52 @@ def check():
     console.print("\n✨ All checks complete!")
 
 
+@cli.command()
+@click.option('--runs', default=3, show_default=True, help='Compilations per backend (first is cold, the rest warm)')
+@click.option('--tex', 'tex_file', type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None, help='LaTeX file to time instead of the built-in reference resume')
+def calibrate(runs: int, tex_file: Path):
+    """Time each installed LaTeX backend and save the fastest as the default."""
+    backends = PdfCompiler.available_backends()
+    if not backends:
+        console.print("❌ No LaTeX backends installed", style="bold red")
+        console.print("   Run [yellow]resumeforge check[/yellow] for install instructions")
+        sys.exit(1)
+    
+    if tex_file:
+        latex_source = tex_file.read_text(encoding='utf-8')
+    else:
+        latex_source = LatexGenerator.generate(SAMPLE_RESUME_DATA)
+    
+    console.print(f"⏱️  Timing {len(backends)} backend(s) with {runs} run(s) each...\n")
+    
+    table = Table(title="LaTeX backend timings")
+    table.add_column("Backend", style="cyan")
+    table.add_column("Cold (s)", justify="right")
+    table.add_column("Warm (s)", justify="right")
+    
+    timings = {}
+    for backend in backends:
+        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
+            progress.add_task(description=f"Compiling with {backend.name}...", total=None)
+            result = PdfCompiler.benchmark(latex_source, backend.name, runs)
+        
+        if result is None:
+            table.add_row(backend.name, "[red]failed[/red]", "[red]failed[/red]")
+        else:
+            cold, warm = result
+            timings[backend.name] = warm
+            table.add_row(backend.name, f"{cold:.2f}", f"{warm:.2f}")
+    
+    console.print(table)
+    
+    if not timings:
+        console.print("❌ No backend could compile the reference resume", style="bold red")
+        sys.exit(1)
+    
+    fastest = min(timings, key=timings.get)
+    config_path = Config.save_latex_backend(fastest)
+    console.print(f"\n✅ Default backend set to [green]{fastest}[/green] (saved to [blue]{config_path}[/blue])", style="bold")
+
+
 if __name__ == "__main__":
     cli()
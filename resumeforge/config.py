@@ -36,6 +36,29 @@ class Config:
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
     
+    @staticmethod
+    def get_latex_backend() -> str:
+        """Get the preferred LaTeX compiler backend (empty if not set)."""
+        return os.getenv("LATEX_BACKEND", "")
+    
+    @staticmethod
+    def save_latex_backend(backend: str):
+        """Persist the preferred LaTeX backend to .resumeforge.env file."""
+        config_path = Path.home() / ".resumeforge.env"
+        
+        lines = []
+        if config_path.exists():
+            lines = [
+                line for line in config_path.read_text().splitlines()
+                if not line.startswith("LATEX_BACKEND=")
+            ]
+        lines.append(f"LATEX_BACKEND={backend}")
+        
+        config_path.write_text("\n".join(lines) + "\n")
+        os.environ["LATEX_BACKEND"] = backend
+        
+        return config_path
+    
     @staticmethod
     def save_config(api_url: str, gemini_key: str, output_dir: str = ""):
         """Save configuration to .resumeforge.env file."""
@@ -48,5 +71,7 @@ class Config:
             f.write(f"MANAGIFY_API_URL={api_url}\n")
             f.write(f"GEMINI_API_KEY={gemini_key}\n")
             f.write(f"OUTPUT_DIR={output_dir}\n")
+            if Config.get_latex_backend():
+                f.write(f"LATEX_BACKEND={Config.get_latex_backend()}\n")
         
         return config_path
@@ -1,47 +1,187 @@
 """PDF compilation from LaTeX source."""
 
+import shutil
 import subprocess
 import tempfile
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 import base64
 
+from .config import Config
+
+
+class LatexBackend(ABC):
+    """A LaTeX engine that can turn a .tex file into a PDF."""
+    
+    name = ""
+    executable = ""
+    passes = 1
+    timeout = 30
+    
+    def is_available(self) -> bool:
+        """Check if this backend's executable is installed (probed once per process)."""
+        return _probe_executable(self.executable)
+    
+    @abstractmethod
+    def build_command(self, tex_file: Path, output_dir: Path) -> List[str]:
+        """Build the command line that compiles tex_file into output_dir."""
+
+
+class PdflatexBackend(LatexBackend):
+    """Plain pdflatex, run twice to resolve references."""
+    
+    name = "pdflatex"
+    executable = "pdflatex"
+    passes = 2
+    
+    def build_command(self, tex_file: Path, output_dir: Path) -> List[str]:
+        return [
+            self.executable,
+            "-interaction=nonstopmode",
+            "-output-directory", str(output_dir),
+            str(tex_file)
+        ]
+
+
+class LualatexBackend(PdflatexBackend):
+    """LuaLaTeX engine."""
+    
+    name = "lualatex"
+    executable = "lualatex"
+
+
+class XelatexBackend(PdflatexBackend):
+    """XeLaTeX engine."""
+    
+    name = "xelatex"
+    executable = "xelatex"
+
+
+class LatexmkBackend(LatexBackend):
+    """latexmk driving pdflatex; it decides how many passes are needed."""
+    
+    name = "latexmk"
+    executable = "latexmk"
+    
+    def build_command(self, tex_file: Path, output_dir: Path) -> List[str]:
+        return [
+            self.executable,
+            "-pdf",
+            "-interaction=nonstopmode",
+            f"-output-directory={output_dir}",
+            str(tex_file)
+        ]
+
+
+class TectonicBackend(LatexBackend):
+    """Tectonic, a self-contained engine that reruns itself as needed."""
+    
+    name = "tectonic"
+    executable = "tectonic"
+    # The first run downloads the TeX support bundle
+    timeout = 120
+    
+    def build_command(self, tex_file: Path, output_dir: Path) -> List[str]:
+        return [
+            self.executable,
+            "--outdir", str(output_dir),
+            str(tex_file)
+        ]
+
+
+BACKENDS: Dict[str, LatexBackend] = {
+    backend.name: backend
+    for backend in (
+        PdflatexBackend(),
+        LatexmkBackend(),
+        LualatexBackend(),
+        XelatexBackend(),
+        TectonicBackend(),
+    )
+}
+
+DEFAULT_BACKEND = "pdflatex"
+
+
+@lru_cache(maxsize=None)
+def _probe_executable(executable: str) -> bool:
+    """Check whether an executable runs; cached so each one is probed once per process."""
+    if shutil.which(executable) is None:
+        return False
+    try:
+        result = subprocess.run(
+            [executable, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return result.returncode == 0
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return False
+
 
 class PdfCompiler:
     """Compile LaTeX source to PDF."""
     
     @staticmethod
-    def check_latex_installed() -> bool:
-        """Check if pdflatex is installed and available."""
-        try:
-            result = subprocess.run(
-                ["pdflatex", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
+    def get_backend(name: Optional[str] = None) -> LatexBackend:
+        """
+        Look up a compiler backend.
+        
+        Args:
+            name: Backend name; defaults to the configured backend
+        
+        Returns:
+            The matching LatexBackend
+        """
+        name = (name or Config.get_latex_backend() or DEFAULT_BACKEND).lower()
+        if name not in BACKENDS:
+            raise ValueError(
+                f"Unknown LaTeX backend '{name}'. "
+                f"Choose one of: {', '.join(BACKENDS)}"
             )
-            return result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+        return BACKENDS[name]
+    
+    @staticmethod
+    def available_backends() -> List[LatexBackend]:
+        """List the backends whose executables are installed."""
+        return [backend for backend in BACKENDS.values() if backend.is_available()]
     
     @staticmethod
-    def compile(latex_source: str, output_path: Path) -> bool:
+    def check_latex_installed(backend: Optional[str] = None) -> bool:
+        """Check if the selected LaTeX backend is installed and available."""
+        return PdfCompiler.get_backend(backend).is_available()
+    
+    @staticmethod
+    def compile(
+        latex_source: str,
+        output_path: Path,
+        backend: Optional[str] = None,
+        quiet: bool = False
+    ) -> bool:
         """
         Compile LaTeX source to PDF.
         
         Args:
             latex_source: LaTeX source code as string
             output_path: Path where the PDF should be saved (without .pdf extension)
+            backend: Backend name; defaults to the configured backend
+            quiet: Suppress the LaTeX log and error messages on failure
         
         Returns:
             True if compilation succeeded, False otherwise
         """
-        if not PdfCompiler.check_latex_installed():
+        engine = PdfCompiler.get_backend(backend)
+        if not engine.is_available():
             raise RuntimeError(
-                "pdflatex not found. Please install a LaTeX distribution:\n"
+                f"{engine.executable} not found. Please install a LaTeX distribution:\n"
                 "  macOS: brew install --cask basictex\n"
                 "  Linux: sudo apt-get install texlive-latex-base texlive-latex-extra\n"
-                "  Windows: https://miktex.org/download"
+                "  Windows: https://miktex.org/download\n"
+                "Or run 'resumeforge calibrate' to pick an installed backend."
             )
         
         # Create a temporary directory for compilation
@@ -53,23 +193,18 @@ class PdfCompiler:
             tex_file.write_text(latex_source, encoding='utf-8')
             
             try:
-                # Run pdflatex twice to resolve references
-                for _ in range(2):
+                for _ in range(engine.passes):
                     result = subprocess.run(
-                        [
-                            "pdflatex",
-                            "-interaction=nonstopmode",
-                            "-output-directory", str(tmpdir_path),
-                            str(tex_file)
-                        ],
+                        engine.build_command(tex_file, tmpdir_path),
                         capture_output=True,
                         text=True,
-                        timeout=30
+                        timeout=engine.timeout
                     )
                     
                     if result.returncode != 0:
-                        print("LaTeX compilation error:")
-                        print(result.stdout)
+                        if not quiet:
+                            print("LaTeX compilation error:")
+                            print(result.stdout or result.stderr)
                         return False
                 
                 # Move the generated PDF to the output location
@@ -79,16 +214,46 @@ class PdfCompiler:
                     output_pdf.write_bytes(pdf_file.read_bytes())
                     return True
                 else:
-                    print("PDF file was not generated")
+                    if not quiet:
+                        print("PDF file was not generated")
                     return False
                     
             except subprocess.TimeoutExpired:
-                print("LaTeX compilation timed out")
+                if not quiet:
+                    print("LaTeX compilation timed out")
                 return False
             except Exception as e:
-                print(f"Error during compilation: {e}")
+                if not quiet:
+                    print(f"Error during compilation: {e}")
                 return False
     
+    @staticmethod
+    def benchmark(latex_source: str, backend: str, runs: int = 3) -> Optional[Tuple[float, float]]:
+        """
+        Time a backend compiling the given source.
+        
+        Args:
+            latex_source: LaTeX source code as string
+            backend: Backend name to time
+            runs: Number of compilations; the first counts as cold, the rest as warm
+        
+        Returns:
+            (cold_seconds, warm_seconds) where warm is the fastest later run,
+            or None if the backend failed to compile the source
+        """
+        timings = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "calibration"
+            for _ in range(max(runs, 1)):
+                start = time.perf_counter()
+                if not PdfCompiler.compile(latex_source, output_path, backend, quiet=True):
+                    return None
+                timings.append(time.perf_counter() - start)
+        
+        cold = timings[0]
+        warm = min(timings[1:]) if len(timings) > 1 else cold
+        return cold, warm
+    
     @staticmethod
     def save_from_base64(base64_data: str, output_path: Path) -> bool:
         """
@@ -0,0 +1,10 @@
+"""Tests for LaTeX resume generation."""
+
+from resumeforge.latex_generator import LatexGenerator, SAMPLE_RESUME_DATA
+
+
+def test_sample_resume_renders_skill_items():
+    latex_source = LatexGenerator.generate(SAMPLE_RESUME_DATA)
+    
+    assert "built-in method" not in latex_source
+    assert r"\textbf{Languages}{: Python, TypeScript, C++, SQL}" in latex_source